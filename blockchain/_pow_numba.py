@@ -0,0 +1,159 @@
+"""
+Optional Numba-accelerated proof-of-work kernel.
+
+This module contains a self-contained SHA-256 implementation written in
+the restricted Python subset that Numba can compile to native code with
+``@njit(nogil=True)``. When :mod:`numba` is installed, the nonce search
+runs entirely outside the CPython interpreter (no per-attempt dispatch,
+no GIL); otherwise the functions remain plain Python and the caller is
+expected to keep using the :mod:`hashlib`-based loop, which is faster
+than interpreted SHA-256.
+
+The kernel operates on the same canonical prefix/suffix split used by
+:meth:`Blockchain.proof_of_work`: the 8-byte big-endian encoding of each
+candidate nonce is written into a scratch buffer between the two parts,
+and the digest is recomputed from scratch. Only the winning nonce is
+returned; the caller derives and verifies the hex hash through the
+normal :meth:`Block.compute_hash` path.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit  # type: ignore
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+
+    def njit(**_kwargs):  # type: ignore
+        """Fallback decorator that leaves the function uncompiled."""
+
+        def decorate(func):
+            return func
+
+        return decorate
+
+
+# SHA-256 round constants (FIPS 180-4).
+_K = (
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5,
+    0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3,
+    0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc,
+    0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7,
+    0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13,
+    0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3,
+    0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5,
+    0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208,
+    0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+)
+
+_MASK32 = 0xFFFFFFFF
+
+
+@njit(nogil=True, cache=True)
+def _rotr(x: int, n: int) -> int:
+    """Rotate the 32-bit value *x* right by *n* bits."""
+    return ((x >> n) | (x << (32 - n))) & _MASK32
+
+
+@njit(nogil=True, cache=True)
+def _digest_meets_difficulty(buf, length, full_bytes, half_nibble):
+    """Hash ``buf[:length]`` with SHA-256 and test the difficulty prefix.
+
+    Returns ``True`` when the first *full_bytes* bytes of the digest are
+    zero and, if *half_nibble* is non-zero, the next byte has a zero high
+    nibble. The padded message is walked virtually so no padded copy of
+    the buffer is ever materialized.
+    """
+    h0, h1, h2, h3 = 0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a
+    h4, h5, h6, h7 = 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+    bitlen = length * 8
+    padded_len = ((length + 8) // 64 + 1) * 64
+    w = [0] * 64
+    for chunk_start in range(0, padded_len, 64):
+        for i in range(16):
+            v = 0
+            for j in range(4):
+                idx = chunk_start + i * 4 + j
+                if idx < length:
+                    b = buf[idx]
+                elif idx == length:
+                    b = 0x80
+                elif idx >= padded_len - 8:
+                    b = (bitlen >> ((padded_len - 1 - idx) * 8)) & 0xFF
+                else:
+                    b = 0
+                v = (v << 8) | b
+            w[i] = v
+        for i in range(16, 64):
+            s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+            s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+            w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & _MASK32
+        a, b_, c, d = h0, h1, h2, h3
+        e, f, g, h = h4, h5, h6, h7
+        for i in range(64):
+            s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+            ch = (e & f) ^ ((~e & _MASK32) & g)
+            temp1 = (h + s1 + ch + _K[i] + w[i]) & _MASK32
+            s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+            maj = (a & b_) ^ (a & c) ^ (b_ & c)
+            temp2 = (s0 + maj) & _MASK32
+            h = g
+            g = f
+            f = e
+            e = (d + temp1) & _MASK32
+            d = c
+            c = b_
+            b_ = a
+            a = (temp1 + temp2) & _MASK32
+        h0 = (h0 + a) & _MASK32
+        h1 = (h1 + b_) & _MASK32
+        h2 = (h2 + c) & _MASK32
+        h3 = (h3 + d) & _MASK32
+        h4 = (h4 + e) & _MASK32
+        h5 = (h5 + f) & _MASK32
+        h6 = (h6 + g) & _MASK32
+        h7 = (h7 + h) & _MASK32
+    digest_words = (h0, h1, h2, h3, h4, h5, h6, h7)
+    for i in range(full_bytes):
+        if (digest_words[i // 4] >> (24 - 8 * (i % 4))) & 0xFF != 0:
+            return False
+    if half_nibble:
+        if (digest_words[full_bytes // 4] >> (24 - 8 * (full_bytes % 4))) & 0xFF >= 0x10:
+            return False
+    return True
+
+
+@njit(nogil=True, cache=True)
+def mine_range(prefix, suffix, full_bytes, half_nibble, start, stride, max_attempts):
+    """Search ``start, start+stride, …`` for a nonce meeting the difficulty.
+
+    *prefix* and *suffix* are the canonical block bytes before and after
+    the nonce. The 8-byte big-endian encoding of each candidate is
+    written into a fixed offset of a shared scratch buffer, so the
+    message length never changes between attempts. Returns the winning
+    nonce, or ``-1`` after *max_attempts* unsuccessful candidates.
+    """
+    length = len(prefix) + 8 + len(suffix)
+    scratch = [0] * length
+    for i in range(len(prefix)):
+        scratch[i] = prefix[i]
+    for i in range(len(suffix)):
+        scratch[len(prefix) + 8 + i] = suffix[i]
+    nonce_offset = len(prefix)
+    nonce = start
+    for _ in range(max_attempts):
+        for i in range(8):
+            scratch[nonce_offset + 7 - i] = (nonce >> (8 * i)) & 0xFF
+        if _digest_meets_difficulty(scratch, length, full_bytes, half_nibble):
+            return nonce
+        nonce += stride
+    return -1
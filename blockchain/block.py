@@ -9,17 +9,109 @@ contents to ensure integrity.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 import json
-import hashlib
 import time
 
+from . import utils
+
+
+class _TxList:
+    """List proxy that flags its owning block when touched.
+
+    Blocks trust their stored hash only while no preimage field has been
+    touched since it was computed (see :attr:`Block._dirty`).
+    Transactions are mutable dictionaries, so even read access can leak
+    a reference that is mutated afterwards; reads that hand out elements
+    therefore mark the owner dirty too, which at worst costs one hash
+    recomputation at the next validation. Mutating operations
+    additionally drop the owner's cached transaction total.
+    """
+
+    __slots__ = ("data", "_owner")
+
+    def __init__(self, data: List[Dict[str, Any]], owner: "Block") -> None:
+        self.data = data
+        self._owner = owner
+
+    def _mutated(self) -> None:
+        self._owner._touch()
+        self._owner._total_amount = None
+
+    # Reads that expose mutable transaction dictionaries.
+    def __getitem__(self, index):
+        self._owner._touch()
+        return self.data[index]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._owner._touch()
+        return iter(self.data)
+
+    # Reads that only compare or count.
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.data
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _TxList):
+            return self.data == other.data
+        return self.data == other
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+    # Mutating operations.
+    def __setitem__(self, index, value) -> None:
+        self._mutated()
+        self.data[index] = value
+
+    def __delitem__(self, index) -> None:
+        self._mutated()
+        del self.data[index]
+
+    def append(self, value: Dict[str, Any]) -> None:
+        self._mutated()
+        self.data.append(value)
+
+    def extend(self, values) -> None:
+        self._mutated()
+        self.data.extend(values)
+
+    def insert(self, index: int, value: Dict[str, Any]) -> None:
+        self._mutated()
+        self.data.insert(index, value)
+
+    def pop(self, index: int = -1) -> Dict[str, Any]:
+        self._mutated()
+        return self.data.pop(index)
+
+    def remove(self, value: Dict[str, Any]) -> None:
+        self._mutated()
+        self.data.remove(value)
+
+    def clear(self) -> None:
+        self._mutated()
+        self.data.clear()
+
 
-@dataclass
 class Block:
     """Represents a single block in the blockchain.
 
+    The class is slotted: long chains hold thousands of Block instances
+    in memory, and ``__slots__`` removes the per-instance ``__dict__``
+    while making the attribute reads in :meth:`compute_hash` and chain
+    validation fixed-offset loads.
+
+    Every field that enters the hash preimage (and the stored hash
+    itself) is wrapped in a property whose setter flags the block as
+    dirty; transaction access goes through :class:`_TxList`, which does
+    the same. A block that has not been flagged since its hash was
+    computed can be accepted by validation without recomputing the
+    digest (see :meth:`Blockchain._verify_block_hash`). Mining and
+    successful verification clear the flag.
+
     Attributes
     ----------
     index : int
@@ -40,37 +132,234 @@ class Block:
         The computed SHA‑256 hash of the current block. This field is
         calculated using the :meth:`compute_hash` method and stored after
         mining. It is not used in the hash computation itself.
+    tx_root : str
+        Hex Merkle root of the transactions (see :func:`utils.merkle_root`),
+        recorded at mining time for version-3 blocks. Informational: hash
+        computation always re-derives the root from ``transactions`` so a
+        tampered stored root cannot mask tampered transactions.
+    version : int
+        The hashing scheme used for this block. Version 1 (legacy) hashes
+        a JSON serialization of the block; version 2 hashes the compact
+        binary layout built by :func:`utils.canonical_block_bytes`;
+        version 3 replaces the serialized transaction list in that layout
+        with its 32-byte Merkle root, making the preimage constant-size.
+        Blocks loaded from storage without a version field are treated as
+        version 1 so existing chains keep validating.
     """
 
-    index: int
-    timestamp: float = field(default_factory=lambda: time.time())
-    transactions: List[Dict[str, Any]] = field(default_factory=list)
-    previous_hash: str = "0"
-    nonce: int = 0
-    hash: str = ""
+    __slots__ = (
+        "_index", "_timestamp", "_transactions", "_previous_hash",
+        "_nonce", "_hash", "_tx_root", "version", "_dirty", "_gen",
+        "_total_amount", "_formatted_timestamp", "_tx_commit", "_json_bytes",
+    )
+
+    def __init__(self, index: int, timestamp: Optional[float] = None,
+                 transactions: Optional[List[Dict[str, Any]]] = None,
+                 previous_hash: str = "0", nonce: int = 0, hash: str = "",
+                 tx_root: str = "", version: int = 3) -> None:
+        self._index = index
+        self._timestamp = time.time() if timestamp is None else timestamp
+        self._transactions = transactions if transactions is not None else []
+        self._previous_hash = previous_hash
+        self._nonce = nonce
+        self._hash = hash
+        self._tx_root = tx_root
+        self.version = version
+        self._total_amount: Optional[float] = None
+        self._json_bytes: Optional[bytes] = None
+        self._formatted_timestamp: Optional[str] = None
+        self._tx_commit: Optional[bytes] = None
+        # Until a hash has been computed for the current contents the
+        # stored hash cannot be trusted by validation.
+        self._dirty = True
+        self._gen = 0
+
+    def _touch(self) -> None:
+        """Flag the block dirty and drop every content-derived cache.
+
+        Single funnel for all mutation events: field setters and
+        transaction exposure (see :class:`_TxList`) both land here. A
+        stale transaction commitment could otherwise make
+        :meth:`compute_hash` reproduce a pre-tamper digest, and the
+        cached serialized form (:meth:`json_bytes`) is dropped for the
+        same reason. The generation counter ``_gen`` increments on every
+        call — unlike ``_dirty`` it is never reset, so external caches
+        keyed on it (the chain's structure-of-arrays cache) detect
+        mutations even after the block is re-mined and clean again.
+        """
+        self._dirty = True
+        self._gen += 1
+        self._tx_commit = None
+        self._json_bytes = None
+
+    def _tx_commitment(self) -> bytes:
+        """Commitment bytes for the transactions, cached between hashes."""
+        commit = self._tx_commit
+        if commit is None:
+            commit = utils.tx_commitment(self._transactions, self.version)
+            self._tx_commit = commit
+        return commit
+
+    # Preimage fields: reads are plain slot loads, writes flag the block.
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @index.setter
+    def index(self, value: int) -> None:
+        self._index = value
+        self._touch()
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: float) -> None:
+        self._timestamp = value
+        self._formatted_timestamp = None
+        self._touch()
+
+    @property
+    def formatted_timestamp(self) -> str:
+        """Human-readable form of :attr:`timestamp`, cached on first use.
+
+        ``datetime.fromtimestamp(...).strftime(...)`` is surprisingly
+        costly in CPython; timestamps are fixed once a block is mined,
+        so the string is formatted at most once per block instead of on
+        every page render.
+        """
+        if self._formatted_timestamp is None:
+            self._formatted_timestamp = utils.format_timestamp(self._timestamp)
+        return self._formatted_timestamp
+
+    @property
+    def previous_hash(self) -> str:
+        return self._previous_hash
+
+    @previous_hash.setter
+    def previous_hash(self, value: str) -> None:
+        self._previous_hash = value
+        self._touch()
+
+    @property
+    def nonce(self) -> int:
+        return self._nonce
+
+    @nonce.setter
+    def nonce(self, value: int) -> None:
+        self._nonce = value
+        self._touch()
+
+    @property
+    def transactions(self) -> _TxList:
+        return _TxList(self._transactions, self)
+
+    @transactions.setter
+    def transactions(self, value) -> None:
+        self._transactions = value.data if isinstance(value, _TxList) else value
+        self._touch()
+        self._total_amount = None
+
+    @property
+    def hash(self) -> str:
+        return self._hash
+
+    @hash.setter
+    def hash(self, value: str) -> None:
+        # Assigning a hash from outside the mining/verification paths
+        # dirties the block, so a forged value is never trusted.
+        self._hash = value
+        self._touch()
+
+    @property
+    def tx_root(self) -> str:
+        return self._tx_root
+
+    @tx_root.setter
+    def tx_root(self, value: str) -> None:
+        # Not part of the preimage (so the block stays clean), but part
+        # of the serialized form, which must be rebuilt.
+        self._tx_root = value
+        self._json_bytes = None
+
+    @property
+    def total_amount(self) -> float:
+        """Sum of the numeric ``amount`` fields of this block's transactions.
+
+        Computed on first access and cached, so rendering the chain view
+        repeatedly costs O(1) per block instead of re-walking every
+        transaction. Non-numeric amounts are ignored, matching the
+        defensive aggregation the web interface used to do inline.
+        """
+        if self._total_amount is None:
+            self._total_amount = sum(
+                float(tx.get("amount", 0))
+                for tx in self._transactions
+                if isinstance(tx.get("amount"), (int, float))
+            )
+        return self._total_amount
 
     def compute_hash(self) -> str:
         """Compute the SHA‑256 hash of the block's contents.
 
         The hash is computed over the block's index, timestamp, list of
         transactions, previous hash and nonce. The resulting hexadecimal
-        digest uniquely identifies the block's contents.
+        digest uniquely identifies the block's contents. Version 2 and 3
+        blocks hash the compact binary preimage from
+        :func:`utils.canonical_block_bytes`; version 1 blocks keep the
+        original JSON preimage for backward compatibility.
 
         Returns
         -------
         str
             The hexadecimal SHA‑256 digest of the block.
         """
-        # Prepare a deterministic representation of the block's state using
-        # json.dumps with sorted keys to ensure consistent ordering.
-        block_string = json.dumps({
-            "index": self.index,
-            "timestamp": self.timestamp,
-            "transactions": self.transactions,
-            "previous_hash": self.previous_hash,
-            "nonce": self.nonce,
-        }, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        return utils.sha256(self.hash_preimage()).hexdigest()
+
+    def hash_preimage(self) -> bytes:
+        """Return the exact byte string that :meth:`compute_hash` digests.
+
+        Version 2 and 3 blocks use the compact binary layout from
+        :func:`utils.canonical_block_bytes` (version 3 commits to the
+        transactions through their Merkle root); version 1 blocks keep
+        the original JSON serialization. Exposed separately so bulk
+        validation can hash several preimages through
+        :func:`utils.sha256_pair`.
+        """
+        if self.version >= 2:
+            return utils.canonical_block_bytes(
+                self._index, self._timestamp, self._transactions,
+                self._previous_hash, self._nonce, self.version,
+                self._tx_commitment(),
+            )
+        # Deterministic legacy representation. The outer object is
+        # composed by hand with its keys already in alphabetical order,
+        # which yields bytes identical to the historical
+        # ``json.dumps(..., sort_keys=True)`` call while skipping the
+        # per-invocation key sort. Transaction dictionaries have
+        # arbitrary keys, so they still go through sort_keys.
+        return (
+            '{"index": ' + json.dumps(self._index)
+            + ', "nonce": ' + json.dumps(self._nonce)
+            + ', "previous_hash": ' + json.dumps(self._previous_hash)
+            + ', "timestamp": ' + json.dumps(self._timestamp)
+            + ', "transactions": ' + json.dumps(self._transactions, sort_keys=True)
+            + "}"
+        ).encode()
+
+    def hash_preimage_prefix(self) -> bytes:
+        """Return the nonce-free leading part of :meth:`hash_preimage`.
+
+        Only meaningful for binary-format blocks (version >= 2), where
+        the nonce is the trailing 8 bytes: the mining loop builds this
+        prefix once, absorbs it into a SHA-256 state, and re-hashes only
+        the packed nonce on each attempt.
+        """
+        return utils.canonical_block_prefix(
+            self._index, self._timestamp, self._transactions,
+            self._previous_hash, self.version, self._tx_commitment(),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the block to a dictionary.
@@ -82,18 +371,58 @@ class Block:
             serialization.
         """
         return {
-            "index": self.index,
-            "timestamp": self.timestamp,
-            "transactions": self.transactions,
-            "previous_hash": self.previous_hash,
-            "nonce": self.nonce,
-            "hash": self.hash,
+            "index": self._index,
+            "timestamp": self._timestamp,
+            "transactions": self._transactions,
+            "previous_hash": self._previous_hash,
+            "nonce": self._nonce,
+            "hash": self._hash,
+            "tx_root": self._tx_root,
+            "version": self.version,
         }
 
+    def json_bytes(self) -> bytes:
+        """Serialized JSONL form of the block, cached between writes.
+
+        Returns the same newline-terminated record as
+        ``persistence.serialize_line(self.to_dict())``, computed at most
+        once per block state: every setter and :meth:`_touch` drop the
+        cache, so rewriting or re-streaming an unchanged chain reuses
+        the bytes instead of re-serializing each block. A cached
+        property cannot be used here because the class is slotted (no
+        per-instance ``__dict__``), and the dictionary itself is not
+        cached because :meth:`to_dict` hands out the live transaction
+        list.
+        """
+        if self._json_bytes is None:
+            # Local import: persistence imports Block at module load.
+            from . import persistence
+
+            self._json_bytes = persistence.serialize_line(self.to_dict())
+        return self._json_bytes
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Block):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"Block(index={self._index}, timestamp={self._timestamp}, "
+            f"transactions={self._transactions!r}, "
+            f"previous_hash={self._previous_hash!r}, nonce={self._nonce}, "
+            f"hash={self._hash!r}, tx_root={self._tx_root!r}, "
+            f"version={self.version})"
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Block":
         """Create a :class:`Block` instance from a dictionary.
 
+        The resulting block is dirty: data loaded from disk or received
+        from a neighbour is untrusted, so its first validation always
+        recomputes the digest.
+
         Parameters
         ----------
         data : Dict[str, Any]
@@ -111,6 +440,10 @@ class Block:
             transactions=data.get("transactions", []),
             previous_hash=data.get("previous_hash", "0"),
             nonce=data.get("nonce", 0),
+            # Blocks serialized before the version field existed hashed
+            # with the JSON preimage, i.e. version 1.
+            version=data.get("version", 1),
         )
         block.hash = data.get("hash", "")
-        return block
\ No newline at end of file
+        block.tx_root = data.get("tx_root", "")
+        return block
@@ -11,13 +11,152 @@ small‑scale applications.
 from __future__ import annotations
 
 from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+import array
+import atexit
+import mmap
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import queue
+import sys
+import threading
+import struct
 import time
-import json
 import os
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    numpy = None
+
 from .block import Block
 from . import utils
 from . import persistence
+from . import _pow_numba
+
+try:
+    # Optional compiled nonce-search extension. It mines over the same
+    # canonical prefix/8-byte big-endian nonce layout as the loops below
+    # but keeps the whole search in C, using the CPU's SHA extensions
+    # where available (message schedule rebuilt only for the block that
+    # the nonce lands in, difficulty checked on the raw digest words).
+    # Built and installed out of tree; this package works without it.
+    from . import _miner  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    _miner = None
+
+
+def _mine_shard(prefix: bytes, suffix: bytes, full_bytes: int, half_nibble: int,
+                start: int, stride: int, stop_event, result_queue,
+                batch: int = 4096) -> None:
+    """Scan the nonce progression ``start, start+stride, …`` for a valid hash.
+
+    Runs in a worker process during parallel mining. *prefix* holds the
+    canonical block bytes before the nonce and *suffix* any bytes after
+    it; each attempt hashes a copy of the pre-absorbed prefix plus the
+    8-byte big-endian nonce and the suffix. On success the winning
+    ``(nonce, hex_digest)`` pair is put on *result_queue* and *stop_event*
+    is set so sibling workers stop. The event is polled once per *batch*
+    attempts to keep synchronization overhead out of the inner loop.
+    """
+    base = utils.sha256(prefix)
+    # Threshold form of the leading-zero rule: the digest has at least
+    # ``2*full_bytes + half_nibble`` zero nibbles iff its big-endian
+    # integer value is below this limit. One int.from_bytes per attempt
+    # replaces the slice allocation and the two-part comparison.
+    limit = 1 << (256 - 8 * full_bytes - 4 * half_nibble)
+    pack_nonce = struct.Struct(">Q").pack
+    nonce = start
+    while not stop_event.is_set():
+        for _ in range(batch):
+            hasher = base.copy()
+            hasher.update(pack_nonce(nonce))
+            hasher.update(suffix)
+            digest = hasher.digest()
+            if int.from_bytes(digest, "big") < limit:
+                result_queue.put((nonce, digest.hex()))
+                stop_event.set()
+                return
+            nonce += stride
+
+
+def _verify_block_hash_plain(block: Block, prefix: str) -> bool:
+    """Check *block*'s stored hash without any memoization."""
+    return bool(block.hash) and block.hash.startswith(prefix) \
+        and block.hash == block.compute_hash()
+
+
+def _verify_hashes_pairwise(chain: List[Block], prefix: str) -> bool:
+    """Verify stored hashes two blocks at a time via :func:`utils.sha256_pair`.
+
+    Feeding independent preimages in pairs lets an interleaved SHA-256
+    backend (see :func:`utils.sha256_pair`) fill its pipeline; with the
+    sequential fallback the result is identical to hashing one block at
+    a time.
+    """
+    n = len(chain)
+    i = 0
+    while i + 1 < n:
+        first, second = chain[i], chain[i + 1]
+        if not first.hash or not second.hash:
+            return False
+        digest_a, digest_b = utils.sha256_pair(
+            first.hash_preimage(), second.hash_preimage()
+        )
+        if digest_a.hex() != first.hash or not first.hash.startswith(prefix):
+            return False
+        if digest_b.hex() != second.hash or not second.hash.startswith(prefix):
+            return False
+        i += 2
+    if i < n:
+        return _verify_block_hash_plain(chain[i], prefix)
+    return True
+
+
+def _is_valid_block_list(chain: List[Block], difficulty: int, verify_hash) -> bool:
+    """Structural and hash validation of a list of blocks.
+
+    Shared between :meth:`Blockchain.is_valid_chain` (which passes its
+    memoizing hash verifier) and the worker processes used by
+    :meth:`Blockchain.resolve_conflicts` (which pass the plain one).
+    *verify_hash* is called as ``verify_hash(block, prefix)``; with the
+    plain verifier, digest recomputation is batched in pairs through
+    :func:`_verify_hashes_pairwise` instead.
+    """
+    if not chain:
+        return False
+    prefix = "0" * difficulty
+    genesis = chain[0]
+    if genesis.index != 0 or genesis.previous_hash != "0":
+        return False
+    for i in range(1, len(chain)):
+        current = chain[i]
+        prev = chain[i - 1]
+        if current.index != i:
+            return False
+        if current.previous_hash != prev.hash:
+            return False
+    if verify_hash is _verify_block_hash_plain:
+        return _verify_hashes_pairwise(chain, prefix)
+    for block in chain:
+        if not verify_hash(block, prefix):
+            return False
+    return True
+
+
+def _validate_and_length(raw_chain: List[Dict[str, Any]], difficulty: int) -> int:
+    """Validate a serialized neighbour chain; return its length, or 0.
+
+    Top-level so it can be pickled into :class:`ProcessPoolExecutor`
+    workers by :meth:`Blockchain.resolve_conflicts`.
+    """
+    try:
+        blocks = [Block.from_dict(b) for b in raw_chain]
+    except Exception:
+        return 0
+    if _is_valid_block_list(blocks, difficulty, _verify_block_hash_plain):
+        return len(blocks)
+    return 0
 
 
 class Blockchain:
@@ -44,18 +183,107 @@ class Blockchain:
     invalid, a new chain is initialized with a genesis block.
     """
 
+    #: Minimum difficulty at which :meth:`proof_of_work` fans the nonce
+    #: search out across worker processes. Below this the expected search
+    #: is too short to amortize process start-up.
+    PARALLEL_DIFFICULTY_THRESHOLD = 4
+
+    #: Minimum number of neighbour chains for which
+    #: :meth:`resolve_conflicts` validates candidates in parallel worker
+    #: processes rather than sequentially in-process.
+    PARALLEL_VALIDATION_MIN_CHAINS = 2
+
+    #: Number of worker processes used by the parallel nonce search.
+    #: ``None`` means one per CPU (``os.cpu_count()``); override on the
+    #: class or an instance to pin miners to fewer cores.
+    MINING_WORKERS: Optional[int] = None
+
+    #: Upper bound on the number of verified block hashes remembered per
+    #: instance. Old entries are evicted least-recently-used so the
+    #: cache stays O(1) memory even across many reorgs.
+    VERIFIED_CACHE_MAX = 100_000
+
+    #: How long (seconds) the background writer waits after an autosave
+    #: operation arrives before flushing, so a burst of mutations
+    #: coalesces into one disk write. Full rewrites (and the explicit
+    #: flushes that follow them) are never delayed.
+    WRITE_COALESCE_DELAY = 0.2
+
+    #: Process pool shared by every instance for candidate-chain
+    #: validation, created lazily so worker start-up is paid once per
+    #: interpreter rather than once per resolve_conflicts call.
+    _validation_executor: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def _get_validation_executor(cls) -> ProcessPoolExecutor:
+        """Return the shared validation pool, creating it on first use."""
+        if cls._validation_executor is None:
+            cls._validation_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return cls._validation_executor
+
     def __init__(self, difficulty: int = 2, autosave: bool = True, storage_path: Optional[str] = None) -> None:
+        # Assigning through the property also derives the cached
+        # difficulty artifacts (see the ``difficulty`` setter).
         self.difficulty = difficulty
         self.autosave = autosave
         self.storage_path = storage_path or os.path.join(os.getcwd(), "blockchain.json")
+        # Sidecar file holding the mutable mempool; the chain file itself
+        # is an append-only log of immutable blocks (one JSON object per
+        # line), so pending transactions are persisted separately.
+        base, ext = os.path.splitext(self.storage_path)
+        self.pending_path = base + ".pending" + (ext or ".json")
+        # Whether the chain file on disk is known to use the append-only
+        # JSONL layout (as opposed to one of the legacy whole-file JSON
+        # formats, which cannot be appended to).
+        self._storage_is_jsonl = False
         # In‑memory list of blocks comprising the chain
         self.chain: List[Block] = []
+        # Per-block transaction counts, kept in a compact typed array and
+        # maintained alongside the chain (append on mine, rebuild on load
+        # or chain replacement) so chart endpoints never re-walk the
+        # chain to count transactions.
+        self.tx_counts = array.array("I")
         # List of pending transactions awaiting inclusion in the next block
         self.pending_transactions: List[Dict[str, Any]] = []
+        # Hashes whose blocks have already been fully verified by this
+        # instance (mined locally or checked during a previous
+        # validation). Lets is_valid_chain — and candidate validation in
+        # resolve_conflicts, where reorg candidates usually share a long
+        # prefix with the current chain — skip the SHA-256 recomputation
+        # for blocks it has seen before; blocks are immutable once
+        # mined. Kept as an insertion-ordered mapping so it can be
+        # trimmed LRU-style at VERIFIED_CACHE_MAX entries.
+        self._verified_hashes: "OrderedDict[str, None]" = OrderedDict()
+        # Cached struct-of-arrays view of the chain used by the NumPy
+        # validation fast path; rebuilt lazily when the chain changes.
+        self._soa_cache: Optional[tuple] = None
+        # Background writer (started lazily): persistence operations are
+        # queued and executed on a daemon thread so mining and transaction
+        # ingestion never wait on disk. See _schedule_write/_writer_loop.
+        self._write_q: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
         # Attempt to load an existing chain; if none exists, create genesis
         if not self.load_chain():
             self.create_genesis_block()
 
+    @property
+    def difficulty(self) -> int:
+        """Proof-of-work difficulty (number of leading zero hex digits)."""
+        return self._difficulty
+
+    @difficulty.setter
+    def difficulty(self, value: int) -> None:
+        # Derive the values that proof_of_work and validation consult on
+        # every call (or every nonce attempt) once per difficulty change
+        # instead of rebuilding them in the hot paths: the hex prefix,
+        # its raw-digest equivalent, and the (full byte, half nibble)
+        # split of the difficulty.
+        self._difficulty = value
+        self._zero_prefix = "0" * value
+        self._diff_full = value // 2
+        self._diff_half = value % 2
+        self._zero_prefix_bytes = b"\x00" * self._diff_full
+
     # ----------------------------------------------------------------------
     # Block and transaction management
     # ----------------------------------------------------------------------
@@ -74,11 +302,17 @@ class Blockchain:
         """
         genesis = Block(index=0, transactions=[], previous_hash="0")
         genesis = self.proof_of_work(genesis)
+        self._remember_verified(genesis.hash)
         self.chain.append(genesis)
+        self.tx_counts.append(0)
         if self.autosave:
             self.save_chain()
         return genesis
 
+    def _rebuild_tx_counts(self) -> None:
+        """Recompute :attr:`tx_counts` from the current chain."""
+        self.tx_counts = array.array("I", (len(b.transactions) for b in self.chain))
+
     def add_transaction(self, transaction: Dict[str, Any]) -> None:
         """Add a new transaction to the list of pending transactions.
 
@@ -99,14 +333,29 @@ class Blockchain:
             If the transaction fails validation.
         """
         utils.validate_transaction(transaction)
+        # Normalize the validated amount to float at the boundary so
+        # every transaction that enters through here carries one numeric
+        # type, and aggregation over locally mined blocks never branches
+        # on it. (Equality is unaffected: 10 == 10.0.)
+        transaction["amount"] = float(transaction["amount"])
         self.pending_transactions.append(transaction)
         # Persist immediately when autosave is enabled to avoid losing
-        # pending transactions between CLI invocations. Minage et
+        # pending transactions between CLI invocations. Only the small
+        # pending sidecar is rewritten here — the chain itself is
+        # untouched by a new transaction, so ingest cost is O(mempool)
+        # instead of O(chain). When the on-disk file still uses a legacy
+        # whole-document format (which embeds the pending list), fall
+        # back to a full rewrite so the two stay consistent. Minage et
         # résolution de conflits réaliseront également une persistance mais
         # l’ajout de transaction est le seul endroit où la liste d’attente
         # est modifiée sans créer un bloc.
         if self.autosave:
-            self.save_chain()
+            if self._storage_is_jsonl:
+                self._schedule_write(
+                    ("pending", persistence.serialize(self.pending_transactions))
+                )
+            else:
+                self.save_chain()
 
     def mine_pending_transactions(self) -> Block:
         """Mine a new block containing all pending transactions.
@@ -135,11 +384,14 @@ class Blockchain:
         block = Block(index=index, transactions=transactions_copy, previous_hash=previous_hash)
         # Perform proof of work
         block = self.proof_of_work(block)
+        # Mining proves the hash, so record it as verified
+        self._remember_verified(block.hash)
         # Append to chain and reset pending transactions
         self.chain.append(block)
+        self.tx_counts.append(len(block.transactions))
         self.pending_transactions = []
         if self.autosave:
-            self.save_chain()
+            self._append_block(block)
         return block
 
     # ----------------------------------------------------------------------
@@ -164,16 +416,140 @@ class Blockchain:
         Block
             The mined block with a valid nonce and hash.
         """
-        prefix = "0" * self.difficulty
-        nonce = 0
-        while True:
+        # Difficulty expressed on the raw digest: a digest has the
+        # required number of leading zero hex digits iff its big-endian
+        # integer value is below ``2**(256 - 4*difficulty)``. Working on
+        # the digest avoids hex-encoding every attempt, and the single
+        # integer compare replaces a slice plus two-part check. The
+        # byte/nibble split is derived once by the ``difficulty`` setter.
+        full_bytes = self._diff_full
+        half_nibble = self._diff_half
+        limit = 1 << (256 - 4 * self._difficulty)
+        # Newly mined blocks use the version-3 canonical preimage, which
+        # commits to the transactions through their Merkle root and ends
+        # with the 8-byte nonce. Build the nonce-free prefix once (the
+        # root is computed here, a single time, however large the
+        # transaction list); each attempt then hashes a copy of the
+        # pre-absorbed prefix plus the packed nonce instead of
+        # re-serializing the whole block.
+        prefix_bytes = block.hash_preimage_prefix()
+        if block.version >= 3:
+            # The prefix build just computed and cached the commitment.
+            block.tx_root = block._tx_commitment().hex()
+        suffix = b""
+        # Fastest path: hand the whole search to the compiled miner when
+        # the extension is present. It returns the winning nonce and hex
+        # digest directly, with no per-nonce Python dispatch at all.
+        if _miner is not None:
+            nonce, block_hash = _miner.mine(prefix_bytes, self.difficulty, 0)
             block.nonce = nonce
-            block_hash = block.compute_hash()
-            if block_hash.startswith(prefix):
+            block.hash = block_hash
+            block._dirty = False
+            return block
+        # Mining is embarrassingly parallel: nonce progressions with
+        # different offsets are disjoint, so the search can be strided
+        # across worker processes. For small difficulties the expected
+        # search is shorter than the cost of spawning workers, so stay
+        # single-process.
+        workers = self.MINING_WORKERS or os.cpu_count() or 1
+        if self.difficulty >= self.PARALLEL_DIFFICULTY_THRESHOLD and workers > 1:
+            result = self._parallel_nonce_search(
+                prefix_bytes, suffix, full_bytes, half_nibble, workers
+            )
+            if result is not None:
+                nonce, block_hash = result
+                block.nonce = nonce
                 block.hash = block_hash
+                block._dirty = False
+                return block
+            # All workers died without a result (see
+            # _parallel_nonce_search); fall through to the in-process
+            # search paths below rather than losing the block.
+        # When Numba is installed, run the whole search in a compiled
+        # kernel: no interpreter dispatch per nonce, which dominates the
+        # cost at the difficulties where the parallel path is not used.
+        # Without Numba the interpreted kernel would be slower than
+        # hashlib, so the plain loop below stays the fallback.
+        if _pow_numba.HAVE_NUMBA:
+            nonce = _pow_numba.mine_range(
+                prefix_bytes, suffix, full_bytes, half_nibble, 0, 1, 1 << 62
+            )
+            if nonce >= 0:
+                block.nonce = nonce
+                block.hash = block.compute_hash()
+                block._dirty = False
+                return block
+        base = utils.sha256(prefix_bytes)
+        pack_nonce = struct.Struct(">Q").pack
+        nonce = 0
+        while True:
+            hasher = base.copy()
+            hasher.update(pack_nonce(nonce))
+            digest = hasher.digest()
+            if int.from_bytes(digest, "big") < limit:
+                block.nonce = nonce
+                # Hex-encode only once, for the winning nonce.
+                block.hash = digest.hex()
+                # Mining just proved this hash: the block starts clean.
+                block._dirty = False
                 return block
             nonce += 1
 
+    def _parallel_nonce_search(self, prefix: bytes, suffix: bytes,
+                               full_bytes: int, half_nibble: int,
+                               workers: int) -> "Optional[tuple[int, str]]":
+        """Run :func:`_mine_shard` across *workers* processes and return the winner.
+
+        Worker ``i`` scans nonces ``i, i+workers, i+2*workers, …`` so the
+        shards partition the nonce space without coordination. The first
+        worker to find a valid hash posts it on a shared queue and sets a
+        stop event that makes the others exit at their next batch boundary.
+
+        The wait on the queue polls worker liveness: if every worker dies
+        without posting a result (OOM kill, crash in a shard), the method
+        logs a diagnostic and returns ``None`` instead of blocking
+        forever, letting :meth:`proof_of_work` fall back to the
+        single-process search.
+        """
+        stop_event = multiprocessing.Event()
+        result_queue: multiprocessing.Queue = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=_mine_shard,
+                args=(prefix, suffix, full_bytes, half_nibble,
+                      i, workers, stop_event, result_queue),
+                daemon=True,
+            )
+            for i in range(workers)
+        ]
+        for proc in processes:
+            proc.start()
+        try:
+            while True:
+                try:
+                    return result_queue.get(timeout=1.0)
+                except queue.Empty:
+                    if any(proc.is_alive() for proc in processes):
+                        continue
+                    # Every worker has exited. One last short wait covers
+                    # a winner whose result was still in flight when it
+                    # died; after that, give up and let the caller fall
+                    # back to the in-process search.
+                    try:
+                        return result_queue.get(timeout=0.5)
+                    except queue.Empty:
+                        print(
+                            "blockchain: parallel mining workers exited "
+                            "without a result; falling back to the "
+                            "single-process search",
+                            file=sys.stderr,
+                        )
+                        return None
+        finally:
+            stop_event.set()
+            for proc in processes:
+                proc.join()
+
     def is_valid_chain(self, chain: Optional[List[Block]] = None) -> bool:
         """Check whether the blockchain (or a supplied chain) is valid.
 
@@ -194,32 +570,139 @@ class Blockchain:
             ``True`` if the chain is valid, ``False`` otherwise.
         """
         chain = chain or self.chain
+        if numpy is not None and chain is self.chain:
+            return self._validate_chain_numpy()
+        return _is_valid_block_list(chain, self.difficulty, self._verify_block_hash)
+
+    def _materialize_arrays(self) -> Optional[tuple]:
+        """Build parallel NumPy arrays (indices, hashes, previous hashes).
+
+        The hex hashes are decoded into ``(N, 32)`` uint8 arrays so the
+        linkage and difficulty checks can run as vectorized comparisons.
+        The arrays are cached, keyed on each block's mutation generation
+        (see :meth:`Block._touch`): any change to any block — even one
+        that is re-mined to a clean, difficulty-meeting hash afterwards
+        — bumps its generation and forces its row to be re-decoded, so
+        the vectorized checks never run on stale values. When the chain
+        has only grown since the last build (the common case — one block
+        appended per mine) and the cached rows' generations are
+        untouched, only the new rows are decoded and appended, so
+        repeated validations cost O(new blocks), not O(chain). Returns
+        ``None`` when a hash is not well-formed hex, in which case the
+        caller falls back to the scalar validation path (which will
+        reject the block).
+        """
+        n = len(self.chain)
+        gens = tuple(block._gen for block in self.chain)
+        key = (id(self.chain), n, gens)
+        if self._soa_cache is not None and self._soa_cache[0] == key:
+            return self._soa_cache[1]
+        start = 0
+        prev_arrays = None
+        if self._soa_cache is not None:
+            (old_id, old_len, old_gens), old_arrays = self._soa_cache
+            # Pure append since the last build: every cached row's block
+            # still carries the generation it was decoded at, so the
+            # rows are an exact prefix and only the new blocks need
+            # decoding.
+            if old_id == id(self.chain) and 0 < old_len <= n \
+                    and gens[:old_len] == old_gens:
+                start = old_len
+                prev_arrays = old_arrays
+        indices = numpy.empty(n - start, dtype=numpy.int64)
+        hashes = numpy.zeros((n - start, 32), dtype=numpy.uint8)
+        prev_hashes = numpy.zeros((n - start, 32), dtype=numpy.uint8)
+        for row, i in enumerate(range(start, n)):
+            block = self.chain[i]
+            indices[row] = block.index
+            try:
+                hashes[row] = numpy.frombuffer(bytes.fromhex(block.hash), dtype=numpy.uint8)
+                if i:
+                    # The genesis previous_hash is the non-hex sentinel "0"
+                    prev_hashes[row] = numpy.frombuffer(
+                        bytes.fromhex(block.previous_hash), dtype=numpy.uint8
+                    )
+            except ValueError:
+                return None
+        if prev_arrays is not None:
+            indices = numpy.concatenate((prev_arrays[0], indices))
+            hashes = numpy.concatenate((prev_arrays[1], hashes))
+            prev_hashes = numpy.concatenate((prev_arrays[2], prev_hashes))
+        arrays = (indices, hashes, prev_hashes)
+        self._soa_cache = (key, arrays)
+        return arrays
+
+    def _validate_chain_numpy(self) -> bool:
+        """Validate the in-memory chain using vectorized structural checks.
+
+        Index continuity, hash/previous-hash linkage and the difficulty
+        prefix are checked with NumPy array comparisons in C; the
+        per-block digest recomputation still goes through the memoized
+        :meth:`_verify_block_hash`.
+        """
+        chain = self.chain
         if not chain:
             return False
-        prefix = "0" * self.difficulty
-        # Validate genesis block separately
         genesis = chain[0]
         if genesis.index != 0 or genesis.previous_hash != "0":
             return False
-        expected_genesis_hash = genesis.compute_hash()
-        if not genesis.hash or not genesis.hash.startswith(prefix) or genesis.hash != expected_genesis_hash:
+        arrays = self._materialize_arrays()
+        if arrays is None:
+            return _is_valid_block_list(chain, self.difficulty, self._verify_block_hash)
+        indices, hashes, prev_hashes = arrays
+        n = len(chain)
+        if not (indices == numpy.arange(n)).all():
+            return False
+        if n > 1 and not numpy.array_equal(hashes[:-1], prev_hashes[1:]):
             return False
-        # Validate subsequent blocks
-        for i in range(1, len(chain)):
-            current = chain[i]
-            prev = chain[i - 1]
-            # Check index continuity
-            if current.index != i:
-                return False
-            # Validate hash chain linkage
-            if current.previous_hash != prev.hash:
-                return False
-            # Compute and compare the hash
-            computed_hash = current.compute_hash()
-            if not computed_hash.startswith(prefix) or current.hash != computed_hash:
-                return False
+        full_bytes = self._diff_full
+        if full_bytes and not (hashes[:, :full_bytes] == 0).all():
+            return False
+        if self._diff_half and not (hashes[:, full_bytes] >> 4 == 0).all():
+            return False
+        return all(
+            self._verify_block_hash(block, self._zero_prefix) for block in chain
+        )
+
+    def _verify_block_hash(self, block: Block, prefix: str) -> bool:
+        """Check that *block*'s stored hash is correct and meets *prefix*.
+
+        Hashes that were already verified by this instance (mined locally
+        or validated earlier) are accepted without recomputing the
+        SHA-256 digest, turning repeated validations of an unchanged
+        chain into set lookups. Both shortcuts require the block to be
+        clean — no preimage field touched since its hash was computed,
+        see :class:`Block` — because a memoized hash only proves what
+        the block contained when it was verified, not what it contains
+        now. Clean blocks missing from the cache are accepted on the
+        difficulty check alone. Newly verified hashes are memoized.
+        """
+        if not block.hash:
+            return False
+        if not block._dirty:
+            cache = self._verified_hashes
+            if block.hash in cache:
+                cache.move_to_end(block.hash)
+                return True
+            if block.hash.startswith(prefix):
+                self._remember_verified(block.hash)
+                return True
+            return False
+        if not block.hash.startswith(prefix) or block.hash != block.compute_hash():
+            return False
+        block._dirty = False
+        self._remember_verified(block.hash)
         return True
 
+    def _remember_verified(self, block_hash: str) -> None:
+        """Record *block_hash* as verified, evicting the oldest entry
+        once :attr:`VERIFIED_CACHE_MAX` hashes are cached."""
+        cache = self._verified_hashes
+        cache[block_hash] = None
+        cache.move_to_end(block_hash)
+        if len(cache) > self.VERIFIED_CACHE_MAX:
+            cache.popitem(last=False)
+
     # ----------------------------------------------------------------------
     # Conflict resolution
     # ----------------------------------------------------------------------
@@ -245,48 +728,265 @@ class Blockchain:
         """
         new_chain: Optional[List[Block]] = None
         max_length = len(self.chain)
-        for raw_chain in neighbour_chains:
-            try:
-                chain_blocks = [Block.from_dict(b) for b in raw_chain]
-            except Exception:
-                # Skip invalid data
-                continue
-            if len(chain_blocks) > max_length and self.is_valid_chain(chain_blocks):
-                max_length = len(chain_blocks)
-                new_chain = chain_blocks
+        # Cheap prefilter: a chain no longer than ours can never be
+        # adopted, so skip it before paying for Block construction (and,
+        # in the parallel path, before shipping it to a worker).
+        candidates = [
+            raw_chain for raw_chain in neighbour_chains
+            if isinstance(raw_chain, list) and len(raw_chain) > max_length
+        ]
+        if len(candidates) >= self.PARALLEL_VALIDATION_MIN_CHAINS:
+            # Each candidate chain is independent and CPU-bound on
+            # SHA-256, so validate them in parallel worker processes and
+            # only deserialize the winner again in the parent.
+            best_raw: Optional[List[Dict[str, Any]]] = None
+            executor = self._get_validation_executor()
+            futures = [
+                executor.submit(_validate_and_length, raw_chain, self.difficulty)
+                for raw_chain in candidates
+            ]
+            for raw_chain, future in zip(candidates, futures):
+                length = future.result()
+                if length > max_length:
+                    max_length = length
+                    best_raw = raw_chain
+            if best_raw is not None:
+                new_chain = [Block.from_dict(b) for b in best_raw]
+                # The workers fully verified these exact dictionaries, so
+                # the rebuilt blocks start out trusted.
+                for b in new_chain:
+                    b._dirty = False
+                    self._remember_verified(b.hash)
+        else:
+            for raw_chain in candidates:
+                if len(raw_chain) <= max_length:
+                    continue
+                try:
+                    chain_blocks = [Block.from_dict(b) for b in raw_chain]
+                except Exception:
+                    # Skip invalid data
+                    continue
+                self._trust_shared_prefix(chain_blocks)
+                if self.is_valid_chain(chain_blocks):
+                    max_length = len(chain_blocks)
+                    new_chain = chain_blocks
         if new_chain:
             self.chain = new_chain
+            self._rebuild_tx_counts()
             if self.autosave:
                 self.save_chain()
             return True
         return False
 
+    def _trust_shared_prefix(self, candidate: List[Block]) -> None:
+        """Mark candidate blocks clean where they replay verified local state.
+
+        Reorg candidates usually share a long prefix with the current
+        chain, but :meth:`Block.from_dict` leaves every rebuilt block
+        dirty, so validating a candidate would recompute SHA-256 even
+        for blocks this node already verified. A candidate block whose
+        serialized record is byte-identical to the clean local block at
+        the same height carries exactly the contents whose hash this
+        node already proved, so it can start clean and validation only
+        pays SHA-256 for the diverged tail. Comparison stops at the
+        first divergence. The parallel path is unaffected: its worker
+        processes always validate candidates in full.
+        """
+        for mine, theirs in zip(self.chain, candidate):
+            if mine._dirty or mine.json_bytes() != theirs.json_bytes():
+                break
+            theirs._dirty = False
+
     # ----------------------------------------------------------------------
     # Persistence
     # ----------------------------------------------------------------------
     def save_chain(self) -> None:
         """Persist the current chain and pending transactions to disk.
 
-        The blockchain state is stored as a dictionary with two keys:
+        La chaîne est stockée au format JSONL : un bloc sérialisé (via
+        :meth:`Block.to_dict`) par ligne. Ce journal « append-only »
+        permet à :meth:`_write_append` d’ajouter un nouveau bloc en O(1)
+        au lieu de réécrire tout le fichier. Les transactions en attente,
+        qui elles sont mutables, vivent dans le fichier annexe
+        :attr:`pending_path`.
+
+        Cette méthode réécrit intégralement le journal (utile après un
+        remplacement de chaîne par :meth:`resolve_conflicts`) ; l’écriture
+        passe par un fichier temporaire renommé atomiquement. Chaque bloc
+        est sérialisé et écrit individuellement, la mémoire de pointe
+        reste donc bornée par le plus gros bloc. Si le répertoire du
+        fichier n’existe pas, il est créé automatiquement. Les erreurs
+        d’écriture lèvent un ``OSError``.
+        """
+        self._schedule_write(
+            (
+                "rewrite",
+                [block.json_bytes() for block in self.chain],
+                persistence.serialize(self.pending_transactions),
+            )
+        )
+        self.flush_writes()
+
+    def _append_block(self, block: Block) -> None:
+        """Schedule the O(1) persistence of one freshly mined block.
+
+        Queues an append of *block* to the on-disk JSONL log (plus the
+        pending sidecar) for the background writer, so mining latency
+        excludes disk writes. The cost is proportional to the block
+        size, not the chain length; if the on-disk file still uses a
+        legacy whole-document format, the writer falls back to a full
+        rewrite and converts it.
+        """
+        self._schedule_write(
+            (
+                "append",
+                block.json_bytes(),
+                [b.json_bytes() for b in self.chain],
+                persistence.serialize(self.pending_transactions),
+            )
+        )
 
-        - ``chain`` : liste des blocs sérialisés (via :meth:`Block.to_dict`)
-        - ``pending_transactions`` : liste des transactions en attente
+    # Low-level writers. They run on the background writer thread and
+    # receive byte snapshots serialized on the caller's thread at
+    # schedule time, never live Block objects, so mutating the
+    # in-memory state after scheduling cannot change what reaches
+    # disk. (Serialization is cheap there: Block.json_bytes caches the
+    # record, so an unchanged block is serialized once ever.)
+    def _write_full(self, lines: List[bytes], pending_data: bytes) -> None:
+        """Réécrit intégralement le journal et le fichier des transactions.
 
-        Cette structure permet de restaurer correctement les transactions en
-        attente lors du prochain chargement, évitant ainsi de les perdre entre
-        deux exécutions de la CLI. Si le répertoire du fichier n’existe pas,
-        il est créé automatiquement. Les erreurs d’écriture lèvent un
-        ``OSError``.
+        *lines* contient les enregistrements JSONL déjà sérialisés, un
+        par bloc, capturés au moment de la mise en file.
         """
         directory = os.path.dirname(self.storage_path)
         if directory and not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-        data = {
-            "chain": [block.to_dict() for block in self.chain],
-            "pending_transactions": list(self.pending_transactions),
-        }
-        with open(self.storage_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        tmp_path = self.storage_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            for line in lines:
+                f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.storage_path)
+        self._storage_is_jsonl = True
+        self._write_pending(pending_data)
+
+    def _write_append(self, line: bytes, lines: List[bytes],
+                      pending_data: bytes) -> None:
+        """Ajoute l’enregistrement sérialisé *line* à la fin du journal JSONL.
+
+        Coût O(taille du bloc) quelle que soit la longueur de la chaîne.
+        Si le fichier existant utilise encore un ancien format (document
+        JSON global) ou n’existe pas, une réécriture complète via
+        :meth:`_write_full` est effectuée à la place.
+        """
+        if not self._storage_is_jsonl or not os.path.exists(self.storage_path):
+            self._write_full(lines, pending_data)
+            return
+        with open(self.storage_path, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._write_pending(pending_data)
+
+    def _write_pending(self, pending_data: bytes) -> None:
+        """Écrit l’instantané sérialisé des transactions en attente."""
+        with open(self.pending_path, "wb") as f:
+            f.write(pending_data)
+
+    # Background writer machinery -----------------------------------------
+    def _schedule_write(self, op: tuple) -> None:
+        """Queue a persistence operation for the background writer thread.
+
+        The writer thread is started on first use and marked as a daemon;
+        an :func:`atexit` hook drains the queue so the last scheduled
+        state always reaches disk before interpreter shutdown.
+        """
+        if self._write_q is None:
+            self._write_q = queue.Queue()
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, daemon=True, name="blockchain-writer"
+            )
+            self._writer_thread.start()
+            atexit.register(self.flush_writes)
+        self._write_q.put(op)
+
+    def _writer_loop(self) -> None:
+        """Drain the write queue, coalescing redundant operations.
+
+        Operations are ``("append", line, lines, pending_data)``,
+        ``("rewrite", lines, pending_data)`` or
+        ``("pending", pending_data)``, all carrying bytes serialized on
+        the scheduling thread — the state they persist is frozen at
+        schedule time. When several operations are queued, everything before
+        the most recent rewrite is dropped — the rewrite already
+        contains that state — and the operations that follow it run in
+        order.
+        """
+        assert self._write_q is not None
+        while True:
+            ops = [self._write_q.get()]
+            # Debounce: hold back briefly after an incremental operation
+            # so a burst of transactions lands in one sidecar write. A
+            # rewrite ends the wait immediately — save_chain queues one
+            # and then blocks on the flush.
+            if ops[0][0] != "rewrite" and self.WRITE_COALESCE_DELAY > 0:
+                deadline = time.monotonic() + self.WRITE_COALESCE_DELAY
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        op = self._write_q.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    ops.append(op)
+                    if op[0] == "rewrite":
+                        break
+            try:
+                while True:
+                    ops.append(self._write_q.get_nowait())
+            except queue.Empty:
+                pass
+            last_rewrite = max(
+                (i for i, op in enumerate(ops) if op[0] == "rewrite"), default=-1
+            )
+            run_ops = ops[max(last_rewrite, 0):]
+            try:
+                for pos, op in enumerate(run_ops):
+                    if op[0] == "rewrite":
+                        self._write_full(op[1], op[2])
+                    elif op[0] == "append":
+                        self._write_append(op[1], op[2], op[3])
+                    elif pos == len(run_ops) - 1:
+                        # Pending-only writes earlier in the batch are
+                        # superseded: every operation after them rewrites
+                        # the sidecar with newer state.
+                        self._write_pending(op[1])
+            except Exception as exc:  # pragma: no cover - disk failure path
+                print(f"blockchain: background save failed: {exc}", file=sys.stderr)
+            finally:
+                for _ in ops:
+                    self._write_q.task_done()
+
+    def flush_writes(self) -> None:
+        """Block until every queued persistence operation has hit disk."""
+        if self._write_q is not None:
+            self._write_q.join()
+
+    def _load_pending(self) -> List[Dict[str, Any]]:
+        """Relit les transactions en attente depuis :attr:`pending_path`.
+
+        Retourne une liste vide si le fichier est absent ou illisible.
+        """
+        if not os.path.exists(self.pending_path):
+            return []
+        try:
+            with open(self.pending_path, "rb") as f:
+                pending = persistence.deserialize(f.read())
+        except Exception:
+            return []
+        return pending if isinstance(pending, list) else []
 
     def load_chain(self) -> bool:
         """Load a blockchain and pending transactions from disk.
@@ -295,10 +995,15 @@ class Blockchain:
 
         1. **Ancien format** : une liste de blocs sérialisés. Dans ce cas les
            transactions en attente sont initialisées à une liste vide.
-        2. **Nouveau format** : un dictionnaire avec les clés ``chain`` et
-           ``pending_transactions``. La chaîne est validée avant d’être
-           acceptée; les transactions en attente sont restaurées sans
-           validation supplémentaire (leur format sera vérifié lors du minage).
+        2. **Format dictionnaire** : un dictionnaire avec les clés ``chain``
+           et ``pending_transactions``.
+        3. **Format courant (JSONL)** : un bloc sérialisé par ligne ; les
+           transactions en attente sont alors relues depuis
+           :attr:`pending_path`.
+
+        Dans tous les cas la chaîne est validée avant d’être acceptée ;
+        les transactions en attente sont restaurées sans validation
+        supplémentaire (leur format sera vérifié lors du minage).
 
         Returns
         -------
@@ -307,26 +1012,58 @@ class Blockchain:
         """
         if not os.path.exists(self.storage_path):
             return False
+        is_jsonl = False
         try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # Déterminer le format du fichier
-            if isinstance(data, list):
-                # Ancien format : liste de blocs
-                loaded_chain = [Block.from_dict(block) for block in data]
-                pending = []
-            elif isinstance(data, dict):
-                loaded_chain = [Block.from_dict(block) for block in data.get("chain", [])]
-                pending = data.get("pending_transactions", [])
-                if not isinstance(pending, list):
-                    pending = []
+            with open(self.storage_path, "rb") as f:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Fichier vide
+                    return False
+            with mapped:
+                # Détection du format sur la première ligne seulement : une
+                # ligne de journal JSONL se parse comme un dictionnaire de
+                # bloc (sans clé ``chain``). Les anciens formats (document
+                # JSON indenté, ou dictionnaire/liste compact avec
+                # ``chain``) échouent ce test et sont relus en entier.
+                first_nl = mapped.find(b"\n")
+                header = mapped[: first_nl if first_nl != -1 else len(mapped)]
+                try:
+                    first_doc = persistence.deserialize(header)
+                except Exception:
+                    first_doc = None
+                if isinstance(first_doc, dict) and "chain" not in first_doc:
+                    is_jsonl = True
+                    data = None
+                else:
+                    data = persistence.deserialize(mapped[:])
+            if is_jsonl:
+                # Format courant : journal JSONL relu via BlockStore
+                # (mmap + index des lignes), qui ne décode qu'un bloc
+                # à la fois ; la mémoire de pointe reste bornée par le
+                # plus gros bloc.
+                with persistence.BlockStore(self.storage_path) as store:
+                    loaded_chain = list(store)
+                pending = self._load_pending()
             else:
-                return False
+                if isinstance(data, list):
+                    # Ancien format : liste de blocs
+                    loaded_chain = [Block.from_dict(block) for block in data]
+                    pending = []
+                elif isinstance(data, dict):
+                    loaded_chain = [Block.from_dict(block) for block in data.get("chain", [])]
+                    pending = data.get("pending_transactions", [])
+                    if not isinstance(pending, list):
+                        pending = []
+                else:
+                    return False
         except Exception:
             return False
         # Validate loaded chain before accepting it
         if self.is_valid_chain(loaded_chain):
             self.chain = loaded_chain
             self.pending_transactions = pending
+            self._storage_is_jsonl = is_jsonl
+            self._rebuild_tx_counts()
             return True
         return False
\ No newline at end of file
@@ -9,13 +9,119 @@ class and can be used independently if desired.
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Tuple
 import json
+import mmap
 import os
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 from .block import Block
 
 
+def serialize(obj: Any, indent: bool = True) -> bytes:
+    """Serialize *obj* to JSON bytes using the fastest available backend.
+
+    Uses :mod:`orjson` (C-implemented, 5-10x faster than the stdlib) when
+    installed, falling back to :mod:`json`. Keys are sorted in both cases
+    so the output is deterministic regardless of backend.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize.
+    indent : bool, optional
+        Whether to pretty-print with a two-space indent. Defaults to
+        ``True`` to keep the on-disk files human-readable.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=True).encode("utf-8")
+
+
+def serialize_line(obj: Any) -> bytes:
+    """Serialize *obj* as one compact, newline-terminated JSONL record.
+
+    With :mod:`orjson` the trailing newline is appended by the C
+    serializer itself (``OPT_APPEND_NEWLINE``), so writing a record to
+    the append-only chain log is a single buffer and a single write
+    call instead of two.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, sort_keys=True) + "\n").encode("utf-8")
+
+
+def deserialize(data: bytes) -> Any:
+    """Parse JSON *data* using :mod:`orjson` when available, else :mod:`json`."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class BlockStore:
+    """Lazy, random-access view over a JSONL chain log.
+
+    The file is memory-mapped and a single scan records the span of
+    every non-empty line; each access then decodes exactly one block,
+    so resident memory stays bounded by the largest block regardless of
+    how long the history is. Behaves as a read-only sequence:
+    ``len(store)``, ``store[i]`` and iteration all work, and the store
+    can be used as a context manager to release the mapping.
+
+    Raises ``ValueError`` for an empty file (nothing can be mapped),
+    mirroring :mod:`mmap` itself.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise
+        self._spans: List[Tuple[int, int]] = []
+        pos = 0
+        size = len(self._map)
+        while pos < size:
+            newline = self._map.find(b"\n", pos)
+            if newline == -1:
+                newline = size
+            if self._map[pos:newline].strip():
+                self._spans.append((pos, newline))
+            pos = newline + 1
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __getitem__(self, index: int) -> Block:
+        start, end = self._spans[index]
+        return Block.from_dict(deserialize(self._map[start:end]))
+
+    def __iter__(self) -> Iterator[Block]:
+        for start, end in self._spans:
+            yield Block.from_dict(deserialize(self._map[start:end]))
+
+    def close(self) -> None:
+        """Release the memory mapping and the underlying file."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "BlockStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
 def save_chain(chain: List[Block], path: str) -> None:
     """Serialize and save a chain of blocks to disk.
 
@@ -31,8 +137,8 @@ def save_chain(chain: List[Block], path: str) -> None:
     if directory and not os.path.exists(directory):
         os.makedirs(directory, exist_ok=True)
     data = [block.to_dict() for block in chain]
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(serialize(data))
 
 
 def load_chain(path: str) -> Optional[List[Block]]:
@@ -52,8 +158,8 @@ def load_chain(path: str) -> Optional[List[Block]]:
     if not os.path.exists(path):
         return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = deserialize(f.read())
         chain = [Block.from_dict(item) for item in data]
         return chain
     except Exception:
@@ -10,6 +10,171 @@ from __future__ import annotations
 
 from typing import Dict, Any
 import datetime as _datetime
+import hashlib as _hashlib_module
+import json as _json
+import platform as _platform
+import struct as _struct
+
+
+def _sha_ni_available() -> bool:
+    """Detect whether the CPU advertises the SHA-NI instruction set.
+
+    The check is informational: when OpenSSL is linked in, its SHA-256
+    implementation dispatches to SHA-NI automatically at runtime. The
+    optional :mod:`cpufeature` or :mod:`cpuinfo` packages are consulted
+    first; on Linux the function falls back to scanning
+    ``/proc/cpuinfo``. Returns ``False`` whenever detection is not
+    possible.
+    """
+    if _platform.machine() not in ("x86_64", "AMD64", "i686"):
+        return False
+    try:
+        import cpufeature  # type: ignore
+
+        return bool(cpufeature.CPUFeature.get("SHA"))
+    except ImportError:
+        pass
+    try:
+        import cpuinfo  # type: ignore
+
+        return "sha_ni" in cpuinfo.get_cpu_info().get("flags", [])
+    except ImportError:
+        pass
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            return " sha_ni" in f.read()
+    except OSError:
+        return False
+
+
+def _best_sha256():
+    """Return the fastest available SHA-256 constructor.
+
+    When CPython is linked against OpenSSL, ``_hashlib.openssl_sha256``
+    is the same accelerated implementation that :func:`hashlib.sha256`
+    wraps, minus the dispatch overhead of the wrapper. On hardware with
+    SHA-NI (see :func:`_sha_ni_available`), OpenSSL 1.1+/3 selects the
+    hardware path automatically. Falls back to :func:`hashlib.sha256`
+    on builds without OpenSSL.
+    """
+    try:
+        import _hashlib  # type: ignore
+
+        return _hashlib.openssl_sha256
+    except (ImportError, AttributeError):
+        return _hashlib_module.sha256
+
+
+#: Preferred SHA-256 constructor, bound once at import time. Hot paths
+#: (:meth:`Block.compute_hash`, :meth:`Blockchain.proof_of_work`) call
+#: this instead of :func:`hashlib.sha256`.
+sha256 = _best_sha256()
+
+#: Whether the host CPU reports SHA-NI support (purely informational).
+SHA_NI_AVAILABLE = _sha_ni_available()
+
+try:
+    # Optional compiled extension interleaving two SHA-256 streams with
+    # SHA-NI intrinsics (the SHA256RNDS2 pipeline is deep enough that two
+    # interleaved streams run at ~2x the throughput of one). Built and
+    # installed out of tree; this package works without it.
+    from . import _sha256_2way  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    _sha256_2way = None
+
+
+def sha256_pair(first: bytes, second: bytes) -> "tuple[bytes, bytes]":
+    """Hash two independent messages, returning both raw digests.
+
+    Dispatches to the two-way interleaved :mod:`_sha256_2way` extension
+    when it is importable, and otherwise hashes the messages
+    sequentially. Chain validation feeds pairs of block preimages
+    through this so an accelerated backend is picked up transparently.
+    """
+    if _sha256_2way is not None:
+        return _sha256_2way.sha256_2way(first, second)
+    return sha256(first).digest(), sha256(second).digest()
+
+
+def merkle_root(transactions: "list") -> bytes:
+    """Compute the Merkle root committing to *transactions*.
+
+    Each transaction is hashed from its compact sorted-key JSON
+    serialization; levels are then built pairwise, duplicating the last
+    node when a level has an odd length (the standard rule). The root is
+    a 32-byte commitment to the whole set, so block preimages can embed
+    it instead of the serialized transaction list and stay constant-size
+    regardless of how many transactions a block carries. An empty list
+    hashes to ``sha256(b"")``.
+    """
+    if not transactions:
+        return sha256(b"").digest()
+    level = [
+        sha256(_json.dumps(tx, sort_keys=True, separators=(",", ":")).encode()).digest()
+        for tx in transactions
+    ]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [
+            sha256(level[i] + level[i + 1]).digest()
+            for i in range(0, len(level), 2)
+        ]
+    return level[0]
+
+
+def tx_commitment(transactions: "list", version: int = 3) -> bytes:
+    """Bytes committing to *transactions* inside a block preimage.
+
+    Version 3 commits through :func:`merkle_root`; version 2 embeds the
+    compact sorted-key JSON serialization directly. Factored out so
+    blocks can cache the commitment across repeated hash computations.
+    """
+    if version >= 3:
+        return merkle_root(transactions)
+    return _json.dumps(transactions, sort_keys=True, separators=(",", ":")).encode()
+
+
+def canonical_block_prefix(index: int, timestamp: float, transactions: "list",
+                           previous_hash: str, version: int = 3,
+                           tx_bytes: "bytes | None" = None) -> bytes:
+    """Build the fixed-layout preimage of a block, minus the nonce.
+
+    Layout: 8-byte big-endian index, 8-byte big-endian timestamp in
+    nanoseconds, the previous hash (decoded from hex when possible, else
+    UTF-8 — the genesis block uses the non-hex sentinel ``"0"``), then a
+    commitment to the transactions. For version 3 that commitment is the
+    32-byte :func:`merkle_root`; version 2 embedded the transaction list
+    as compact JSON with sorted keys. Plain JSON is used at the leaves
+    rather than an optional binary codec so the resulting hashes never
+    depend on which third-party packages are installed.
+
+    The nonce is appended separately (see :func:`canonical_block_bytes`)
+    so that the mining loop can reuse this prefix across attempts. A
+    caller that already holds the :func:`tx_commitment` for the list
+    can pass it as *tx_bytes* to skip recomputing it.
+    """
+    try:
+        prev = bytes.fromhex(previous_hash)
+    except ValueError:
+        prev = previous_hash.encode()
+    if tx_bytes is None:
+        tx_bytes = tx_commitment(transactions, version)
+    return _struct.pack(">QQ", index, int(timestamp * 1_000_000_000)) + prev + tx_bytes
+
+
+def canonical_block_bytes(index: int, timestamp: float, transactions: "list",
+                          previous_hash: str, nonce: int, version: int = 3,
+                          tx_bytes: "bytes | None" = None) -> bytes:
+    """Full canonical preimage of a binary-format block: prefix plus 8-byte nonce."""
+    return canonical_block_prefix(index, timestamp, transactions, previous_hash,
+                                  version, tx_bytes) \
+        + _struct.pack(">Q", nonce)
+
+
+#: Keys every transaction must carry. Hoisted to module scope so
+#: :func:`validate_transaction` does not rebuild the set per call.
+_REQUIRED_TX_FIELDS = frozenset(("sender", "recipient", "amount"))
 
 
 def validate_transaction(transaction: Dict[str, Any]) -> None:
@@ -18,8 +183,8 @@ def validate_transaction(transaction: Dict[str, Any]) -> None:
     Each transaction is expected to be a dictionary containing at least the
     keys ``sender``, ``recipient`` and ``amount``. Additional fields are
     permitted but must not shadow these reserved keys. The ``amount`` should
-    be a positive number (integer or float). If the transaction fails any
-    of these checks, a :class:`ValueError` is raised.
+    be a positive number (integer or float; booleans are rejected). If the
+    transaction fails any of these checks, a :class:`ValueError` is raised.
 
     Parameters
     ----------
@@ -31,12 +196,15 @@ def validate_transaction(transaction: Dict[str, Any]) -> None:
     ValueError
         If the transaction is missing required keys or has invalid values.
     """
-    required_fields = {"sender", "recipient", "amount"}
-    missing = required_fields - transaction.keys()
-    if missing:
+    # Fast path: one subset test; only build the missing-key set when the
+    # transaction is actually invalid.
+    if not _REQUIRED_TX_FIELDS.issubset(transaction):
+        missing = _REQUIRED_TX_FIELDS - transaction.keys()
         raise ValueError(f"Transaction missing required fields: {', '.join(missing)}")
     amount = transaction["amount"]
-    if not isinstance(amount, (int, float)) or amount <= 0:
+    # Exact type check is cheaper than isinstance and also rules out bool
+    # (a subclass of int that isinstance would let through).
+    if type(amount) not in (int, float) or amount <= 0:
         raise ValueError("Transaction amount must be a positive number")
 
 
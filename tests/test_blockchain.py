@@ -34,9 +34,10 @@ class BlockchainTestCase(unittest.TestCase):
         self.bc = Blockchain(difficulty=2, autosave=False, storage_path=self.temp_file)
 
     def tearDown(self) -> None:
-        # Clean up the temporary storage file
-        if os.path.exists(self.temp_file):
-            os.remove(self.temp_file)
+        # Clean up the temporary storage file and its pending sidecar
+        for path in (self.temp_file, self.bc.pending_path):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_genesis_block_created(self) -> None:
         """Ensure the genesis block is created on initialization."""
@@ -75,6 +76,43 @@ class BlockchainTestCase(unittest.TestCase):
         self.bc.chain[1].hash = self.bc.chain[1].compute_hash()
         self.assertFalse(self.bc.is_valid_chain())
 
+    def test_validation_detects_remined_interior_block(self) -> None:
+        """A mutated and re-mined interior block breaks the chain linkage.
+
+        Unlike plain tampering, the re-mined block has a valid,
+        difficulty-meeting hash of its own — only the next block's
+        ``previous_hash`` betrays the change. Repeated validation first,
+        so the result does not depend on cached state from an earlier
+        pass (both the scalar and the vectorized path must re-read the
+        mutated block).
+        """
+        for i in range(2):
+            self.bc.add_transaction({"sender": "A", "recipient": "B", "amount": i + 1})
+            self.bc.mine_pending_transactions()
+        self.assertTrue(self.bc.is_valid_chain())
+        middle = self.bc.chain[1]
+        middle.transactions[0]["amount"] = 999
+        self.bc.proof_of_work(middle)
+        self.assertFalse(self.bc.is_valid_chain())
+
+    def test_block_is_slotted(self) -> None:
+        """Blocks carry no per-instance __dict__ and round-trip via dicts."""
+        block = self.bc.chain[0]
+        self.assertFalse(hasattr(block, "__dict__"))
+        restored = Block.from_dict(block.to_dict())
+        self.assertEqual(restored, block)
+
+    def test_persistence_roundtrip(self) -> None:
+        """Chain and pending transactions survive a save/load cycle."""
+        self.bc.add_transaction({"sender": "A", "recipient": "B", "amount": 2})
+        self.bc.mine_pending_transactions()
+        self.bc.add_transaction({"sender": "C", "recipient": "D", "amount": 3})
+        self.bc.save_chain()
+        restored = Blockchain(difficulty=2, autosave=False, storage_path=self.temp_file)
+        self.assertEqual(len(restored.chain), len(self.bc.chain))
+        self.assertEqual(restored.pending_transactions, self.bc.pending_transactions)
+        self.assertTrue(restored.is_valid_chain())
+
     def test_conflict_resolution(self) -> None:
         """Test the resolve_conflicts method selects the longest valid chain."""
         # Create a neighbour chain longer than current chain
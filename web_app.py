@@ -18,14 +18,52 @@ Le serveur écoute par défaut sur http://localhost:5000.
 
 from __future__ import annotations
 
-from flask import Flask, render_template, request, redirect, url_for, flash
-from datetime import datetime
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, session
 from blockchain.blockchain import Blockchain
+from blockchain import persistence
+import gzip
 import os
 
+try:
+    from flask_compress import Compress  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    Compress = None
+
 app = Flask(__name__)
 app.secret_key = "change-me"  # clé secrète pour les messages flash
 
+# Compression des réponses : le HTML de /chain est très compressible
+# (~10x) et domine la bande passante pour les longues chaînes. Le niveau
+# 1 garde le surcoût CPU négligeable ; les petites réponses sont servies
+# telles quelles. flask-compress est utilisé quand il est installé,
+# sinon un repli gzip minimal suffit.
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_LEVEL"] = 1
+if Compress is not None:
+    Compress(app)
+else:
+    @app.after_request
+    def _gzip_response(response):
+        """Repli gzip quand flask-compress n’est pas installé."""
+        # Les réponses générées en flux (comme /chain.ndjson) sont
+        # laissées telles quelles : get_data() les matérialiserait en
+        # entier, annulant la mémoire bornée côté serveur.
+        if (
+            response.direct_passthrough
+            or response.is_streamed
+            or not 200 <= response.status_code < 300
+            or "gzip" not in request.headers.get("Accept-Encoding", "").lower()
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+        data = response.get_data()
+        if len(data) < app.config["COMPRESS_MIN_SIZE"]:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=app.config["COMPRESS_LEVEL"]))
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
 # Chemin de stockage par défaut ; peut être modifié via variable d’environnement
 STORAGE_PATH = os.environ.get("BLOCKCHAIN_STORAGE", "blockchain.json")
 DIFFICULTY = int(os.environ.get("BLOCKCHAIN_DIFFICULTY", 2))
@@ -34,47 +72,105 @@ DIFFICULTY = int(os.environ.get("BLOCKCHAIN_DIFFICULTY", 2))
 # différentes requêtes. Cette instance est utilisée dans toutes les routes.
 blockchain = Blockchain(difficulty=DIFFICULTY, autosave=True, storage_path=STORAGE_PATH)
 
+# Cache en mémoire des pages rendues : entre deux minages la page /chain
+# est identique octet pour octet, inutile de refaire l’agrégation et le
+# rendu Jinja à chaque visite. Chaque entrée associe une route à
+# ``(clé d’état, HTML rendu)`` ; la clé incorpore le hash du dernier bloc
+# (et selon la page la taille de la file d’attente), donc toute mutation
+# de l’état — bloc miné, transaction ajoutée — invalide l’entrée
+# d’elle-même, sans coordination explicite avec les routes de mutation.
+_page_cache: dict = {}
+
+
+def _tip_hash() -> str:
+    """Hash du dernier bloc, utilisé comme clé d’état de la chaîne."""
+    return blockchain.chain[-1].hash if blockchain.chain else ""
+
+
+def _render_cached(name: str, state_key, render):
+    """Retourne la page en cache pour *name* si la clé d’état correspond.
+
+    Les pages contenant des messages flash dépendent de la session ; dans
+    ce cas la page est rendue normalement et n’est pas mise en cache.
+    """
+    if session.get("_flashes"):
+        return render()
+    cached = _page_cache.get(name)
+    if cached is not None and cached[0] == state_key:
+        return cached[1]
+    page = render()
+    _page_cache[name] = (state_key, page)
+    return page
+
 
 @app.route("/")
 def index():
     """Page d’accueil affichant quelques statistiques et liens rapides."""
-    labels = [str(b.index) for b in blockchain.chain]
-    tx_counts = [len(b.transactions) for b in blockchain.chain]
-    return render_template(
-        "index.html",
-        chain_length=len(blockchain.chain),
-        difficulty=blockchain.difficulty,
-        labels=labels,
-        tx_counts=tx_counts,
-    )
+
+    def render():
+        # Compteurs maintenus par la Blockchain au fil des minages : pas
+        # besoin de reparcourir les blocs. Une chaîne valide a toujours
+        # des index consécutifs depuis zéro, les étiquettes s’en déduisent.
+        tx_counts = list(blockchain.tx_counts)
+        labels = [str(i) for i in range(len(tx_counts))]
+        return render_template(
+            "index.html",
+            chain_length=len(blockchain.chain),
+            difficulty=blockchain.difficulty,
+            labels=labels,
+            tx_counts=tx_counts,
+        )
+
+    return _render_cached("index", (_tip_hash(), blockchain.difficulty), render)
 
 
 @app.route("/chain")
 def show_chain():
-    """Affiche la liste des blocs avec leurs transactions."""
-    table_data = []
-    for b in blockchain.chain:
-        total = sum(
-            float(tx.get("amount", 0))
-            for tx in b.transactions
-            if isinstance(tx.get("amount"), (int, float))
-        )
-        table_data.append(
-            {
-                "index": b.index,
-                "timestamp": datetime.fromtimestamp(b.timestamp).strftime("%Y-%m-%d %H:%M:%S"),
-                "tx_count": len(b.transactions),
-                "total": total,
-            }
-        )
-    return render_template("chain.html", chain=blockchain.chain, table_data=table_data)
+    """Affiche la page de la chaîne (coquille rendue côté client).
+
+    La page ne contient plus les blocs eux-mêmes : le navigateur les
+    récupère depuis :func:`stream_chain` et construit le tableau et
+    l’accordéon au fil de l’eau. Le serveur ne rend donc qu’un gabarit
+    de taille constante, quelle que soit la longueur de la chaîne.
+    """
+    return _render_cached(
+        "chain", _tip_hash(), lambda: render_template("chain.html")
+    )
+
+
+@app.route("/chain.ndjson")
+def stream_chain():
+    """Flux NDJSON de la chaîne : un bloc sérialisé par ligne.
+
+    La réponse est générée bloc par bloc, la mémoire de pointe côté
+    serveur reste donc bornée par le plus gros bloc et le navigateur
+    peut afficher les premiers blocs avant la fin du transfert. Chaque
+    enregistrement reprend :meth:`Block.to_dict` complété des champs
+    d’affichage précalculés sur le bloc (date formatée, total des
+    montants).
+    """
+
+    def generate():
+        for b in blockchain.chain:
+            record = b.to_dict()
+            record["formatted_timestamp"] = b.formatted_timestamp
+            record["total_amount"] = b.total_amount
+            yield persistence.serialize_line(record)
+
+    return Response(generate(), mimetype="application/x-ndjson")
 
 
 @app.route("/pending")
 def show_pending():
     """Affiche les transactions en attente de minage."""
-    return render_template(
-        "pending.html", pending=blockchain.pending_transactions
+
+    def render():
+        return render_template(
+            "pending.html", pending=blockchain.pending_transactions
+        )
+
+    return _render_cached(
+        "pending", (_tip_hash(), len(blockchain.pending_transactions)), render
     )
 
 